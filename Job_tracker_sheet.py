@@ -1,27 +1,132 @@
-import pandas as pd
-from openpyxl.styles import PatternFill, Font, Alignment
+from openpyxl import Workbook, LXML
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import PatternFill, Font, Alignment, NamedStyle
 from openpyxl.styles.borders import Border, Side
-from openpyxl.utils import get_column_letter
 from openpyxl.worksheet.datavalidation import DataValidation
 from openpyxl.chart import PieChart, BarChart, Reference
 from openpyxl.chart.label import DataLabelList
 from openpyxl.formatting.rule import FormulaRule
-import gspread
-from google.oauth2.service_account import Credentials
-from datetime import datetime
+from openpyxl.worksheet.filters import AutoFilter
+from openpyxl.worksheet.table import Table, TableColumn
+from datetime import datetime, timedelta
 import os
+import warnings
 
-def create_excel_job_tracker(output_file='Job_Tracker.xlsx'):
-    """Create an Excel job tracker with dashboard"""
-    
-    # Define column headers for main tracker
-    headers = [
-        '#', 'Company Name', 'Job Title', 'Job Location', 'Date Applied',
-        'Job Posting Link', 'Resume Link', 'Cover Letter Link', 
-        'Application Status', 'Follow-Up Date', 'Response Received?', 'Notes'
-    ]
-    
-    # Create sample data for demonstration
+# Column headers for the main tracker
+HEADERS = (
+    '#', 'Company Name', 'Job Title', 'Job Location', 'Date Applied',
+    'Job Posting Link', 'Resume Link', 'Cover Letter Link', 
+    'Application Status', 'Follow-Up Date', 'Response Received?', 'Notes'
+)
+
+# Last row covered by status validation and conditional formatting (Excel
+# imports with more rows extend past it) and by the Google Sheets chart ranges
+MAX_DATA_ROW = 10000
+
+# Excel column widths (characters)
+EXCEL_COLUMN_WIDTHS = (
+    ('A', 5),    # #
+    ('B', 25),   # Company Name
+    ('C', 25),   # Job Title
+    ('D', 20),   # Job Location
+    ('E', 15),   # Date Applied
+    ('F', 40),   # Job Posting Link
+    ('G', 40),   # Resume Link
+    ('H', 40),   # Cover Letter Link
+    ('I', 20),   # Application Status
+    ('J', 15),   # Follow-Up Date
+    ('K', 20),   # Response Received?
+    ('L', 40)    # Notes
+)
+
+# Google Sheets column widths (pixels)
+SHEETS_COLUMN_WIDTHS = (
+    (1, 50),    # #
+    (2, 150),   # Company Name
+    (3, 150),   # Job Title
+    (4, 120),   # Job Location
+    (5, 100),   # Date Applied
+    (6, 250),   # Job Posting Link
+    (7, 250),   # Resume Link
+    (8, 250),   # Cover Letter Link
+    (9, 120),   # Application Status
+    (10, 100),  # Follow-Up Date
+    (11, 150),  # Response Received?
+    (12, 250)   # Notes
+)
+
+# Application statuses and their highlight colors
+STATUS_COLORS = (
+    ('Applied', 'ADD8E6'),              # Light Blue
+    ('Interview Scheduled', '90EE90'),  # Light Green
+    ('Offer', 'FFFF00'),                # Gold/Yellow
+    ('Rejected', 'FF9999'),             # Light Red
+    ('Followed Up', 'FFA500'),          # Orange
+    ('No Response', 'D3D3D3'),          # Light Gray
+    ('On Hold', 'E6E6FA')               # Lavender
+)
+STATUSES = tuple(status for status, _ in STATUS_COLORS)
+
+# Google Sheets takes colors as 0-1 RGB fractions
+SHEETS_STATUS_COLORS = tuple(
+    (status, {
+        'red': round(int(color[0:2], 16) / 255, 3),
+        'green': round(int(color[2:4], 16) / 255, 3),
+        'blue': round(int(color[4:6], 16) / 255, 3)
+    })
+    for status, color in STATUS_COLORS
+)
+
+# Excel conditional formatting fills, one per status. Fills are safe to share;
+# FormulaRule objects are not (openpyxl writes priority and dxfId into them),
+# so rules are built per workbook in apply_conditional_formatting
+STATUS_FILLS = tuple(
+    (status, PatternFill(start_color=color, end_color=color, fill_type="solid"))
+    for status, color in STATUS_COLORS
+)
+
+# Dashboard metric card styling, shared by every card cell
+THIN = Side(style='thin')
+CARD_FILL = PatternFill(start_color="F0F0F0", end_color="F0F0F0", fill_type="solid")
+CARD_BORDER = Border(left=THIN, right=THIN, top=THIN, bottom=THIN)
+
+# Dashboard metric cards as (label, formula), shared by Excel and Google Sheets
+DASHBOARD_METRICS = (
+    ("Total Applied", "COUNTIF('Job Applications'!I:I,\"*\")"),
+    ("Interviews", "COUNTIF('Job Applications'!I:I,\"Interview Scheduled\")"),
+    ("Offers", "COUNTIF('Job Applications'!I:I,\"Offer\")"),
+    ("Rejections", "COUNTIF('Job Applications'!I:I,\"Rejected\")"),
+    ("Follow-ups Needed", "COUNTIF('Job Applications'!I:I,\"Followed Up\")"),
+    ("No Response", "COUNTIF('Job Applications'!I:I,\"No Response\")")
+)
+
+# Status highlight formula for the first data row; Google Sheets prefixes '='
+STATUS_FORMULA = '$I2="{status}"'
+
+# Excel dashboard layout shared by both engines; rows and columns are 1-indexed
+DASHBOARD_TITLE = "Job Application Dashboard"
+DASHBOARD_TITLE_RANGE = 'A1:D1'
+CARD_ROWS, CARD_COLS = 2, 3
+
+# Excel dashboard charts; columns are 1-indexed tracker columns
+STATUS_CHART = {
+    'title': "Application Status Distribution",
+    'anchor': "A15",
+    'categories_col': 9,   # Application Status
+    'values_col': 9
+}
+DAILY_CHART = {
+    'title': "Daily Applications",
+    'anchor': "I15",
+    'categories_col': 5,   # Date Applied
+    'values_col': 1,       # #
+    'style': 10,
+    'x_axis': "Date",
+    'y_axis': "Count"
+}
+
+def sample_rows():
+    """Build sample tracker rows for demonstration, in HEADERS order"""
     sample_data = [
         {
             '#': 1,
@@ -34,149 +139,322 @@ def create_excel_job_tracker(output_file='Job_Tracker.xlsx'):
             '#': 2,
             'Company Name': 'Data Inc',
             'Job Title': 'Data Analyst',
-            'Date Applied': (datetime.today() - pd.Timedelta(days=3)).strftime('%Y-%m-%d'),
+            'Date Applied': (datetime.today() - timedelta(days=3)).strftime('%Y-%m-%d'),
             'Application Status': 'Interview Scheduled'
         }
     ]
+    return [[row.get(header) for header in HEADERS] for row in sample_data]
+
+def dashboard_card_cells():
+    """Map each Excel metric card cell (row, column) to (value, role)
+    
+    role is 'label', 'value' or 'card' for the blank rest of the card.
+    """
+    cells = {}
+    for i, (label, formula) in enumerate(DASHBOARD_METRICS):
+        row = 3 + (i // 2) * 3
+        col = 2 + (i % 2) * 5
+        for r in range(row, row + CARD_ROWS):
+            for c in range(col, col + CARD_COLS):
+                cells[(r, c)] = (None, 'card')
+        cells[(row, col)] = (label, 'label')
+        cells[(row + 1, col)] = (f'={formula}', 'value')
+    return cells
+
+def apply_data_validation(worksheet, last_row=MAX_DATA_ROW):
+    """Add the Application Status dropdown to an Excel tracker sheet"""
+    dv = DataValidation(type="list", formula1=f'"{",".join(STATUSES)}"', allow_blank=True)
+    worksheet.data_validations.append(dv)
+    dv.add(f'I2:I{last_row}')  # Apply to the column except header
+
+def apply_conditional_formatting(worksheet, last_row=MAX_DATA_ROW):
+    """Highlight Excel tracker rows (columns A-L) by Application Status"""
+    for status, fill in STATUS_FILLS:
+        rule = FormulaRule(formula=[STATUS_FORMULA.format(status=status)], fill=fill)
+        worksheet.conditional_formatting.add(f'A2:L{last_row}', rule)
+
+def apply_xlsxwriter_data_validation(worksheet, last_row=MAX_DATA_ROW):
+    """Add the Application Status dropdown to an xlsxwriter tracker sheet"""
+    worksheet.data_validation(f'I2:I{last_row}', {
+        'validate': 'list',
+        'source': list(STATUSES),
+        'show_input': False,
+        'show_error': False  # Accept free text, like the openpyxl engine
+    })
+
+def apply_xlsxwriter_conditional_formatting(workbook, worksheet, last_row=MAX_DATA_ROW):
+    """Highlight xlsxwriter tracker rows (columns A-L) by Application Status"""
+    for status, color in STATUS_COLORS:
+        worksheet.conditional_format(f'A2:L{last_row}', {
+            'type': 'formula',
+            'criteria': '=' + STATUS_FORMULA.format(status=status),
+            'format': workbook.add_format({'bg_color': f'#{color}'})
+        })
+
+def status_validation_request(sheet_id):
+    """Build the Sheets request adding the Application Status dropdown"""
+    return {
+        "setDataValidation": {
+            # Column I (9th column), rows 2 to MAX_DATA_ROW
+            "range": {
+                "sheetId": sheet_id,
+                "startRowIndex": 1,
+                "endRowIndex": MAX_DATA_ROW,
+                "startColumnIndex": 8,
+                "endColumnIndex": 9
+            },
+            "rule": {
+                "condition": {
+                    "type": "ONE_OF_LIST",
+                    "values": [{"userEnteredValue": status} for status in STATUSES]
+                },
+                "strict": True,
+                "showCustomUi": True
+            }
+        }
+    }
+
+def status_format_requests(sheet_id):
+    """Build the Sheets requests highlighting rows by Application Status"""
+    requests = []
+    for status, color in SHEETS_STATUS_COLORS:
+        rule = {
+            "ranges": [{
+                "sheetId": sheet_id,
+                "startRowIndex": 1,
+                "endRowIndex": MAX_DATA_ROW,
+                "startColumnIndex": 0,
+                "endColumnIndex": 12
+            }],
+            "booleanRule": {
+                "condition": {
+                    "type": "CUSTOM_FORMULA",
+                    "values": [{"userEnteredValue": '=' + STATUS_FORMULA.format(status=status)}]
+                },
+                "format": {
+                    "backgroundColor": color
+                }
+            }
+        }
+        requests.append({"addConditionalFormatRule": {
+            "index": 0,
+            "rule": rule
+        }})
+    return requests
+
+def create_excel_job_tracker(output_file='Job_Tracker.xlsx', rows=None, engine='openpyxl'):
+    """Create an Excel job tracker with dashboard
     
-    # Create DataFrame
-    df = pd.DataFrame(columns=headers)
-    df = pd.concat([df, pd.DataFrame(sample_data)], ignore_index=True)
+    rows is an iterable of row sequences in HEADERS order (sample rows if
+    omitted). Both engines stream rows to disk, so rows are consumed once
+    and written strictly in order; a generator keeps memory flat for large
+    imports. engine is 'openpyxl' (write-only mode) or 'xlsxwriter'
+    (constant_memory mode).
+    """
     
-    # Create Excel writer
-    writer = pd.ExcelWriter(output_file, engine='openpyxl')
-    df.to_excel(writer, index=False, sheet_name='Job Applications')
+    if rows is None:
+        rows = sample_rows()
     
-    # Get workbook and worksheet
-    workbook = writer.book
-    worksheet = writer.sheets['Job Applications']
+    if engine == 'xlsxwriter':
+        return create_xlsxwriter_job_tracker(output_file, rows)
+    if engine != 'openpyxl':
+        raise ValueError(f"Unsupported engine: {engine}")
     
-    # Format headers
-    header_font = Font(bold=True)
-    for col_num, header in enumerate(headers, 1):
-        cell = worksheet.cell(row=1, column=col_num)
-        cell.font = header_font
+    if not LXML:
+        print("Warning: lxml is not installed, falling back to the slower XML writer. "
+              "Install it with: pip install lxml")
     
-    # Set column widths
-    column_widths = {
-        'A': 5,    # #
-        'B': 25,   # Company Name
-        'C': 25,   # Job Title
-        'D': 20,   # Job Location
-        'E': 15,   # Date Applied
-        'F': 40,   # Job Posting Link
-        'G': 40,   # Resume Link
-        'H': 40,   # Cover Letter Link
-        'I': 20,   # Application Status
-        'J': 15,   # Follow-Up Date
-        'K': 20,   # Response Received?
-        'L': 40    # Notes
-    }
+    # Create write-only workbook; column widths and freeze panes must be set
+    # before any rows are appended
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet('Job Applications')
     
-    for col, width in column_widths.items():
+    # Set column widths
+    for col, width in EXCEL_COLUMN_WIDTHS:
         worksheet.column_dimensions[col].width = width
     
-    # Add data validation for Application Status
-    dv = DataValidation(type="list", formula1='"Applied,Interview Scheduled,Offer,Rejected,Followed Up,No Response,On Hold"', 
-                       allow_blank=True)
-    worksheet.add_data_validation(dv)
-    dv.add(f'I2:I1048576')  # Apply to entire column except header
-    
-    # Define conditional formatting colors
-    status_colors = {
-        'Applied': 'ADD8E6',          # Light Blue
-        'Interview Scheduled': '90EE90',  # Light Green
-        'Offer': 'FFFF00',            # Gold/Yellow
-        'Rejected': 'FF9999',          # Light Red
-        'Followed Up': 'FFA500',       # Orange
-        'No Response': 'D3D3D3',       # Light Gray
-        'On Hold': 'E6E6FA'           # Lavender
-    }
+    # Freeze top row (sheet views are written with the first row)
+    worksheet.freeze_panes = 'A2'
     
-    # Apply conditional formatting
-    for status, color in status_colors.items():
-        fill = PatternFill(start_color=color, end_color=color, fill_type="solid")
-        formula = f'$I2="{status}"'
-        
-        # Create a Rule object
-        rule = FormulaRule(formula=[formula], fill=fill)
-        
-        # Apply to entire row (columns A-L)
-        for col in range(1, 13):
-            column_letter = get_column_letter(col)
-            worksheet.conditional_formatting.add(
-                f'{column_letter}2:{column_letter}1048576',
-                rule
-            )
+    # Format headers with a named style registered once per workbook
+    header_style = NamedStyle(name='Tracker Header', font=Font(bold=True))
+    workbook.add_named_style(header_style)
+    header_cells = []
+    for header in HEADERS:
+        cell = WriteOnlyCell(worksheet, value=header)
+        cell.style = header_style.name
+        header_cells.append(cell)
+    worksheet.append(header_cells)
     
-    # Freeze top row
-    worksheet.freeze_panes = 'A2'
+    # Add data rows
+    row_count = 0
+    for row_count, row in enumerate(rows, 1):
+        worksheet.append(list(row))
+    
+    # Add data validation and conditional formatting for Application Status.
+    # Both are written after the rows, so they can cover every imported row.
+    last_data_row = max(MAX_DATA_ROW, row_count + 1)
+    apply_data_validation(worksheet, last_data_row)
+    apply_conditional_formatting(worksheet, last_data_row)
+    
+    # Wrap the data in a table (at least one data row) so Excel grows it, and
+    # the charts over its columns, as rows are typed in below it
+    table_last_row = max(row_count, 1) + 1
+    table_ref = f'A1:L{table_last_row}'
+    table = Table(displayName='JobApplications', ref=table_ref,
+                  autoFilter=AutoFilter(ref=table_ref),
+                  tableColumns=[TableColumn(id=i, name=header)
+                                for i, header in enumerate(HEADERS, 1)])
+    with warnings.catch_warnings():
+        # openpyxl warns that write-only tables need manual columns; they are set above
+        warnings.simplefilter('ignore')
+        worksheet.add_table(table)
     
     # ========== DASHBOARD CREATION ==========
     dashboard = workbook.create_sheet(title="📈 Dashboard")
     
     # Dashboard layout
-    dashboard.merge_cells('A1:D1')
-    dashboard['A1'] = "Job Application Dashboard"
-    dashboard['A1'].font = Font(size=18, bold=True)
-    dashboard['A1'].alignment = Alignment(horizontal='center')
-    
-    # Create metric cards
-    metrics = [
-        ("Total Applied", "COUNTIF('Job Applications'!I:I,\"*\")"),
-        ("Interviews", "COUNTIF('Job Applications'!I:I,\"Interview Scheduled\")"),
-        ("Offers", "COUNTIF('Job Applications'!I:I,\"Offer\")"),
-        ("Rejections", "COUNTIF('Job Applications'!I:I,\"Rejected\")"),
-        ("Follow-ups Needed", "COUNTIF('Job Applications'!I:I,\"Followed Up\")"),
-        ("No Response", "COUNTIF('Job Applications'!I:I,\"No Response\")")
-    ]
+    dashboard.merged_cells.add(DASHBOARD_TITLE_RANGE)
+    title_cell = WriteOnlyCell(dashboard, value=DASHBOARD_TITLE)
+    title_cell.font = Font(size=18, bold=True)
+    title_cell.alignment = Alignment(horizontal='center')
+    dashboard_cells = {(1, 1): title_cell}
     
-    # Position metric cards
-    for i, (label, formula) in enumerate(metrics):
-        row = 3 + (i // 2) * 3
-        col = 2 + (i % 2) * 5
-        
-        # Metric label
-        dashboard.cell(row=row, column=col, value=label).font = Font(bold=True)
-        
-        # Metric value
-        dashboard.cell(row=row+1, column=col, value=f'={formula}').font = Font(size=14, bold=True)
-        
-        # Format as card
-        for r in range(row, row+2):
-            for c in range(col, col+3):
-                cell = dashboard.cell(row=r, column=c)
-                cell.fill = PatternFill(start_color="F0F0F0", end_color="F0F0F0", fill_type="solid")
-                cell.border = Border(left=Side(style='thin'), right=Side(style='thin'), 
-                                   top=Side(style='thin'), bottom=Side(style='thin'))
+    # Format metric cards
+    card_fonts = {'label': Font(bold=True), 'value': Font(size=14, bold=True)}
+    for (r, c), (value, role) in dashboard_card_cells().items():
+        cell = WriteOnlyCell(dashboard, value=value)
+        cell.fill = CARD_FILL
+        cell.border = CARD_BORDER
+        if role in card_fonts:
+            cell.font = card_fonts[role]
+        dashboard_cells[(r, c)] = cell
+    
+    # Write-only sheets are streamed top to bottom, so emit the dashboard row by row
+    max_row = max(r for r, _ in dashboard_cells)
+    max_col = max(c for _, c in dashboard_cells)
+    for r in range(1, max_row + 1):
+        dashboard.append([dashboard_cells.get((r, c)) for c in range(1, max_col + 1)])
+    
+    # Charts cover the table's columns
     
     # Create pie chart for status distribution
     pie = PieChart()
-    labels = Reference(worksheet, min_col=9, min_row=2, max_row=100)
-    data = Reference(worksheet, min_col=9, min_row=1, max_row=100)
+    labels = Reference(worksheet, min_col=STATUS_CHART['categories_col'], min_row=2, max_row=table_last_row)
+    data = Reference(worksheet, min_col=STATUS_CHART['values_col'], min_row=1, max_row=table_last_row)
     pie.add_data(data, titles_from_data=True)
     pie.set_categories(labels)
-    pie.title = "Application Status Distribution"
+    pie.title = STATUS_CHART['title']
     pie.dataLabels = DataLabelList()
     pie.dataLabels.showPercent = True
-    dashboard.add_chart(pie, "A15")
+    dashboard.add_chart(pie, STATUS_CHART['anchor'])
     
     # Create bar chart for daily applications
     bar = BarChart()
-    dates = Reference(worksheet, min_col=5, min_row=2, max_row=100)
-    counts = Reference(worksheet, min_col=1, min_row=1, max_row=100)
+    dates = Reference(worksheet, min_col=DAILY_CHART['categories_col'], min_row=2, max_row=table_last_row)
+    counts = Reference(worksheet, min_col=DAILY_CHART['values_col'], min_row=1, max_row=table_last_row)
     bar.add_data(counts, titles_from_data=True)
     bar.set_categories(dates)
-    bar.title = "Daily Applications"
-    bar.style = 10
-    bar.y_axis.title = "Count"
-    bar.x_axis.title = "Date"
-    dashboard.add_chart(bar, "I15")
+    bar.title = DAILY_CHART['title']
+    bar.style = DAILY_CHART['style']
+    bar.y_axis.title = DAILY_CHART['y_axis']
+    bar.x_axis.title = DAILY_CHART['x_axis']
+    dashboard.add_chart(bar, DAILY_CHART['anchor'])
     
     # Save the workbook
     workbook.save(output_file)
     print(f"Excel job tracker with dashboard created successfully: {output_file}")
 
+def create_xlsxwriter_job_tracker(output_file, rows):
+    """Create the Excel job tracker with xlsxwriter in constant_memory mode
+    
+    constant_memory flushes each row as soon as a later row is started, so
+    rows must be written strictly top to bottom; anything written to an
+    earlier row afterwards is silently dropped. It also rules out tables,
+    so unlike the openpyxl engine the dashboard charts cover only the rows
+    written and won't pick up rows added later in Excel.
+    """
+    
+    import xlsxwriter
+    
+    workbook = xlsxwriter.Workbook(output_file, {'constant_memory': True})
+    worksheet = workbook.add_worksheet('Job Applications')
+    
+    # Set column widths
+    for col, width in EXCEL_COLUMN_WIDTHS:
+        worksheet.set_column(f'{col}:{col}', width)
+    
+    # Freeze top row
+    worksheet.freeze_panes(1, 0)
+    
+    # Write headers, then data rows in order
+    worksheet.write_row(0, 0, HEADERS, workbook.add_format({'bold': True}))
+    row_count = 0
+    for row_count, row in enumerate(rows, 1):
+        worksheet.write_row(row_count, 0, row)
+    
+    # Add data validation and conditional formatting for Application Status;
+    # both are written at close(), so they can cover every imported row
+    last_data_row = max(MAX_DATA_ROW, row_count + 1)
+    apply_xlsxwriter_data_validation(worksheet, last_data_row)
+    apply_xlsxwriter_conditional_formatting(workbook, worksheet, last_data_row)
+    
+    # ========== DASHBOARD CREATION ==========
+    dashboard = workbook.add_worksheet("📈 Dashboard")
+    
+    # Dashboard layout
+    dashboard.merge_range(DASHBOARD_TITLE_RANGE, DASHBOARD_TITLE,
+                          workbook.add_format({'font_size': 18, 'bold': True, 'align': 'center'}))
+    
+    # Write metric cards row by row (xlsxwriter is 0-indexed)
+    card = {'bg_color': '#F0F0F0', 'border': 1}
+    card_formats = {
+        'card': workbook.add_format(card),
+        'label': workbook.add_format({**card, 'bold': True}),
+        'value': workbook.add_format({**card, 'font_size': 14, 'bold': True})
+    }
+    for (r, c), (value, role) in sorted(dashboard_card_cells().items()):
+        if value is None:
+            dashboard.write_blank(r - 1, c - 1, None, card_formats[role])
+        else:
+            dashboard.write(r - 1, c - 1, value, card_formats[role])
+    
+    # Tables aren't supported in constant_memory mode, so the charts cover
+    # only the rows written here (at least one) and won't grow with new rows
+    last_idx = max(row_count, 1)
+    
+    # Create pie chart for status distribution
+    pie = workbook.add_chart({'type': 'pie'})
+    categories_col = STATUS_CHART['categories_col'] - 1
+    values_col = STATUS_CHART['values_col'] - 1
+    pie.add_series({
+        'name': ['Job Applications', 0, values_col],
+        'categories': ['Job Applications', 1, categories_col, last_idx, categories_col],
+        'values': ['Job Applications', 1, values_col, last_idx, values_col],
+        'data_labels': {'percentage': True}
+    })
+    pie.set_title({'name': STATUS_CHART['title']})
+    dashboard.insert_chart(STATUS_CHART['anchor'], pie)
+    
+    # Create bar chart for daily applications
+    bar = workbook.add_chart({'type': 'column'})
+    categories_col = DAILY_CHART['categories_col'] - 1
+    values_col = DAILY_CHART['values_col'] - 1
+    bar.add_series({
+        'name': ['Job Applications', 0, values_col],
+        'categories': ['Job Applications', 1, categories_col, last_idx, categories_col],
+        'values': ['Job Applications', 1, values_col, last_idx, values_col]
+    })
+    bar.set_title({'name': DAILY_CHART['title']})
+    bar.set_style(DAILY_CHART['style'])
+    bar.set_y_axis({'name': DAILY_CHART['y_axis']})
+    bar.set_x_axis({'name': DAILY_CHART['x_axis']})
+    dashboard.insert_chart(DAILY_CHART['anchor'], bar)
+    
+    # Save the workbook
+    workbook.close()
+    print(f"Excel job tracker with dashboard created successfully: {output_file}")
+
 def create_google_sheets_job_tracker(creds_file=None, sheet_name='Job Tracker'):
     """Create a Google Sheets job tracker with dashboard"""
     
@@ -184,6 +462,10 @@ def create_google_sheets_job_tracker(creds_file=None, sheet_name='Job Tracker'):
         print("Google Sheets creation requires a credentials file.")
         return
     
+    # Google client libraries are only needed for this option
+    import gspread
+    from google.oauth2.service_account import Credentials
+    
     try:
         # Authenticate with Google Sheets API
         scopes = ['https://www.googleapis.com/auth/spreadsheets',
@@ -197,96 +479,67 @@ def create_google_sheets_job_tracker(creds_file=None, sheet_name='Job Tracker'):
         
         # Get the first worksheet (main tracker)
         worksheet = spreadsheet.get_worksheet(0)
-        worksheet.update_title("Job Applications")
-        
-        # Define column headers
-        headers = [
-            '#', 'Company Name', 'Job Title', 'Job Location', 'Date Applied',
-            'Job Posting Link', 'Resume Link', 'Cover Letter Link', 
-            'Application Status', 'Follow-Up Date', 'Response Received?', 'Notes'
-        ]
-        
-        # Update the worksheet with headers
-        worksheet.append_row(headers)
-        
-        # Format headers (bold)
-        header_format = {
-            "textFormat": {"bold": True}
-        }
-        worksheet.format('A1:L1', header_format)
-        
-        # Set column widths
-        column_widths = {
-            1: 50,    # #
-            2: 150,   # Company Name
-            3: 150,   # Job Title
-            4: 120,   # Job Location
-            5: 100,   # Date Applied
-            6: 250,   # Job Posting Link
-            7: 250,   # Resume Link
-            8: 250,   # Cover Letter Link
-            9: 120,   # Application Status
-            10: 100,   # Follow-Up Date
-            11: 150,   # Response Received?
-            12: 250    # Notes
-        }
-        
-        # Google Sheets uses pixel widths
-        worksheet.resize_columns(column_widths)
         
-        # Add data validation for Application Status
-        validation_rule = {
-            "condition": {
-                "type": "ONE_OF_LIST",
-                "values": ["Applied", "Interview Scheduled", "Offer", "Rejected", 
-                          "Followed Up", "No Response", "On Hold"]
-            },
-            "strict": True,
-            "showCustomUi": True
-        }
-        
-        # Apply to column I (9th column)
-        start_cell = gspread.utils.rowcol_to_a1(2, 9)
-        end_cell = gspread.utils.rowcol_to_a1(1000, 9)
-        range_notation = f"{start_cell}:{end_cell}"
-        
-        worksheet.set_data_validation(range_notation, validation_rule)
-        
-        # Define conditional formatting rules
-        status_colors = {
-            'Applied': {'red': 0.678, 'green': 0.847, 'blue': 0.902},
-            'Interview Scheduled': {'red': 0.565, 'green': 0.933, 'blue': 0.565},
-            'Offer': {'red': 1.0, 'green': 1.0, 'blue': 0.0},
-            'Rejected': {'red': 1.0, 'green': 0.6, 'blue': 0.6},
-            'Followed Up': {'red': 1.0, 'green': 0.647, 'blue': 0.0},
-            'No Response': {'red': 0.827, 'green': 0.827, 'blue': 0.827},
-            'On Hold': {'red': 0.902, 'green': 0.902, 'blue': 0.980}
-        }
+        # Every change below is sent in a single batch_update; the tracker
+        # grid is grown first so later ranges up to MAX_DATA_ROW are valid
+        requests = [{
+            "updateSheetProperties": {
+                "properties": {
+                    "sheetId": worksheet.id,
+                    "title": "Job Applications",
+                    "gridProperties": {"rowCount": MAX_DATA_ROW}
+                },
+                "fields": "title,gridProperties.rowCount"
+            }
+        }]
         
-        # Apply conditional formatting
-        requests = []
-        for status, color in status_colors.items():
-            rule = {
-                "ranges": [{
+        # Write the headers (bold)
+        requests.append({
+            "updateCells": {
+                "range": {
                     "sheetId": worksheet.id,
-                    "startRowIndex": 1,
+                    "startRowIndex": 0,
+                    "endRowIndex": 1,
                     "startColumnIndex": 0,
-                    "endColumnIndex": 12
+                    "endColumnIndex": len(HEADERS)
+                },
+                "rows": [{
+                    "values": [{
+                        "userEnteredValue": {"stringValue": header},
+                        "userEnteredFormat": {"textFormat": {"bold": True}}
+                    } for header in HEADERS]
                 }],
-                "booleanRule": {
-                    "condition": {
-                        "type": "CUSTOM_FORMULA",
-                        "values": [{"userEnteredValue": f'=$I2="{status}"'}]
+                "fields": "userEnteredValue,userEnteredFormat.textFormat"
+            }
+        })
+        
+        # Set column widths
+        # Google Sheets uses pixel widths; adjacent columns with the same
+        # width share one request
+        width_runs = []
+        for col, width in SHEETS_COLUMN_WIDTHS:
+            if width_runs and width_runs[-1][1] == col - 1 and width_runs[-1][2] == width:
+                width_runs[-1][1] = col
+            else:
+                width_runs.append([col - 1, col, width])
+        
+        for start, end, width in width_runs:
+            requests.append({
+                "updateDimensionProperties": {
+                    "range": {
+                        "sheetId": worksheet.id,
+                        "dimension": "COLUMNS",
+                        "startIndex": start,
+                        "endIndex": end
                     },
-                    "format": {
-                        "backgroundColor": color
-                    }
+                    "properties": {"pixelSize": width},
+                    "fields": "pixelSize"
                 }
-            }
-            requests.append({"addConditionalFormatRule": {
-                "index": 0,
-                "rule": rule
-            }})
+            })
+        
+        # Add data validation and conditional formatting for Application Status
+        requests.append(status_validation_request(worksheet.id))
+        requests.extend(status_format_requests(worksheet.id))
         
         # Freeze the top row
         freeze_request = {
@@ -303,13 +556,22 @@ def create_google_sheets_job_tracker(creds_file=None, sheet_name='Job Tracker'):
         requests.append(freeze_request)
         
         # ========== CREATE DASHBOARD ==========
-        dashboard = spreadsheet.add_worksheet(title="📈 Dashboard", rows=100, cols=20)
+        dashboard_id = worksheet.id + 1
+        requests.append({
+            "addSheet": {
+                "properties": {
+                    "sheetId": dashboard_id,
+                    "title": "📈 Dashboard",
+                    "gridProperties": {"rowCount": 100, "columnCount": 20}
+                }
+            }
+        })
         
         # Dashboard header
         requests.append({
             "repeatCell": {
                 "range": {
-                    "sheetId": dashboard.id,
+                    "sheetId": dashboard_id,
                     "startRowIndex": 0,
                     "endRowIndex": 1,
                     "startColumnIndex": 0,
@@ -323,10 +585,12 @@ def create_google_sheets_job_tracker(creds_file=None, sheet_name='Job Tracker'):
                     }
                 },
                 "fields": "userEnteredValue,userEnteredFormat.textFormat,userEnteredFormat.horizontalAlignment"
-            },
+            }
+        })
+        requests.append({
             "mergeCells": {
                 "range": {
-                    "sheetId": dashboard.id,
+                    "sheetId": dashboard_id,
                     "startRowIndex": 0,
                     "endRowIndex": 1,
                     "startColumnIndex": 0,
@@ -336,56 +600,43 @@ def create_google_sheets_job_tracker(creds_file=None, sheet_name='Job Tracker'):
             }
         })
         
-        # Add metric cards
+        # Add metric cards as (row index, column index, label, formula), 0-indexed;
+        # the value goes in the row below its label
         metrics = [
-            ("A3", "Total Applied", "=COUNTIF('Job Applications'!I:I,\"*\")"),
-            ("G3", "Interviews", "=COUNTIF('Job Applications'!I:I,\"Interview Scheduled\")"),
-            ("A8", "Offers", "=COUNTIF('Job Applications'!I:I,\"Offer\")"),
-            ("G8", "Rejections", "=COUNTIF('Job Applications'!I:I,\"Rejected\")"),
-            ("A13", "Follow-ups Needed", "=COUNTIF('Job Applications'!I:I,\"Followed Up\")"),
-            ("G13", "No Response", "=COUNTIF('Job Applications'!I:I,\"No Response\")")
+            (2 + (i // 2) * 5, (i % 2) * 6, label, f'={formula}')
+            for i, (label, formula) in enumerate(DASHBOARD_METRICS)
         ]
         
-        for cell, label, formula in metrics:
-            # Label
-            requests.append({
-                "updateCells": {
-                    "range": {
-                        "sheetId": dashboard.id,
-                        "startRowIndex": int(cell[1:])-1,
-                        "endRowIndex": int(cell[1:]),
-                        "startColumnIndex": ord(cell[0].upper())-65,
-                        "endColumnIndex": ord(cell[0].upper())-64
-                    },
-                    "rows": [{
-                        "values": [{
-                            "userEnteredValue": {"stringValue": label},
-                            "userEnteredFormat": {"textFormat": {"bold": True}}
-                        }]
-                    }],
-                    "fields": "userEnteredValue,userEnteredFormat.textFormat"
+        # Write each band of cards (label row + value row) in one request
+        bands = {}
+        for row_idx, col_idx, label, formula in metrics:
+            bands.setdefault(row_idx, []).append((col_idx, label, formula))
+        
+        for row_idx, cards in bands.items():
+            width = max(col_idx for col_idx, _, _ in cards) + 1
+            label_cells = [{} for _ in range(width)]
+            value_cells = [{} for _ in range(width)]
+            for col_idx, label, formula in cards:
+                label_cells[col_idx] = {
+                    "userEnteredValue": {"stringValue": label},
+                    "userEnteredFormat": {"textFormat": {"bold": True}}
+                }
+                value_cells[col_idx] = {
+                    "userEnteredValue": {"formulaValue": formula},
+                    "userEnteredFormat": {
+                        "textFormat": {"fontSize": 14, "bold": True},
+                        "backgroundColor": {"red": 0.94, "green": 0.94, "blue": 0.94}
+                    }
                 }
-            })
             
-            # Value
             requests.append({
                 "updateCells": {
-                    "range": {
-                        "sheetId": dashboard.id,
-                        "startRowIndex": int(cell[1:]),
-                        "endRowIndex": int(cell[1:])+1,
-                        "startColumnIndex": ord(cell[0].upper())-65,
-                        "endColumnIndex": ord(cell[0].upper())-64
+                    "start": {
+                        "sheetId": dashboard_id,
+                        "rowIndex": row_idx,
+                        "columnIndex": 0
                     },
-                    "rows": [{
-                        "values": [{
-                            "userEnteredValue": {"formulaValue": formula},
-                            "userEnteredFormat": {
-                                "textFormat": {"fontSize": 14, "bold": True},
-                                "backgroundColor": {"red": 0.94, "green": 0.94, "blue": 0.94}
-                            }
-                        }]
-                    }],
+                    "rows": [{"values": label_cells}, {"values": value_cells}],
                     "fields": "userEnteredValue,userEnteredFormat"
                 }
             })
@@ -403,7 +654,7 @@ def create_google_sheets_job_tracker(creds_file=None, sheet_name='Job Tracker'):
                                     "sources": [{
                                         "sheetId": worksheet.id,
                                         "startRowIndex": 1,
-                                        "endRowIndex": 100,
+                                        "endRowIndex": MAX_DATA_ROW,
                                         "startColumnIndex": 8,
                                         "endColumnIndex": 9
                                     }]
@@ -414,7 +665,7 @@ def create_google_sheets_job_tracker(creds_file=None, sheet_name='Job Tracker'):
                                     "sources": [{
                                         "sheetId": worksheet.id,
                                         "startRowIndex": 0,
-                                        "endRowIndex": 100,
+                                        "endRowIndex": MAX_DATA_ROW,
                                         "startColumnIndex": 8,
                                         "endColumnIndex": 9
                                     }]
@@ -426,7 +677,7 @@ def create_google_sheets_job_tracker(creds_file=None, sheet_name='Job Tracker'):
                     "position": {
                         "overlayPosition": {
                             "anchorCell": {
-                                "sheetId": dashboard.id,
+                                "sheetId": dashboard_id,
                                 "rowIndex": 15,
                                 "columnIndex": 0
                             }
@@ -454,7 +705,7 @@ def create_google_sheets_job_tracker(creds_file=None, sheet_name='Job Tracker'):
                                         "sources": [{
                                             "sheetId": worksheet.id,
                                             "startRowIndex": 1,
-                                            "endRowIndex": 100,
+                                            "endRowIndex": MAX_DATA_ROW,
                                             "startColumnIndex": 4,
                                             "endColumnIndex": 5
                                         }]
@@ -467,7 +718,7 @@ def create_google_sheets_job_tracker(creds_file=None, sheet_name='Job Tracker'):
                                         "sources": [{
                                             "sheetId": worksheet.id,
                                             "startRowIndex": 0,
-                                            "endRowIndex": 100,
+                                            "endRowIndex": MAX_DATA_ROW,
                                             "startColumnIndex": 0,
                                             "endColumnIndex": 1
                                         }]
@@ -480,7 +731,7 @@ def create_google_sheets_job_tracker(creds_file=None, sheet_name='Job Tracker'):
                     "position": {
                         "overlayPosition": {
                             "anchorCell": {
-                                "sheetId": dashboard.id,
+                                "sheetId": dashboard_id,
                                 "rowIndex": 15,
                                 "columnIndex": 8
                             }
@@ -492,7 +743,7 @@ def create_google_sheets_job_tracker(creds_file=None, sheet_name='Job Tracker'):
         requests.append(bar_chart_request)
         
         # Batch update the spreadsheet
-        spreadsheet.batch_update(requests)
+        spreadsheet.batch_update({"requests": requests})
         
         print(f"Google Sheets job tracker with dashboard created successfully: {spreadsheet.url}")
         return spreadsheet.url